@@ -1,10 +1,32 @@
 # import math
-# import collections
+import collections
+import multiprocessing
 
 import ROOT
+import uproot
+import awkward as ak
 import numpy as np
 import pandas as pd
 
+# namedtuple classes used by _Collection.rows(), per object class and members
+_rowClasses = {}
+
+# object classes with a _Field per member, per object class and members
+_objectClasses = {}
+
+
+def _mapRange(args):
+    """Applies a function to the events of an entry range, in a worker process of HGCalNtuple.map()."""
+    fileName, tree, prefixes, stepSize, castSchema, fn, start, stop = args
+    # the processes already use all the CPUs, so no decompression threads
+    with HGCalNtuple(fileName, tree, prefixes, stepSize, decompressionWorkers=0) as ntuple:
+        ntuple.castSchema = castSchema
+        results = [np.atleast_1d(fn(event)) for event in ntuple._events(start, stop)]
+    if not results:
+        return None
+    return np.concatenate(results)
+
+
 class _Collection(object):
     """Adaptor class representing a collection of objects.
 
@@ -12,23 +34,32 @@ class _Collection(object):
 
     """
 
-    def __init__(self, tree, sizeBranch, objclass, prefix):
+    __slots__ = ("_columns", "_sizeColumn", "_objclass", "_prefix", "_flyweight", "_members")
+
+    # members returned by default by numbaViews()
+    _numbaFields = ()
+
+    def __init__(self, columns, sizeColumn, objclass, prefix, flyweight=False):
         """Constructor.
 
         Arguments:
-        tree        -- TTree object
-        sizeBranch  -- Name of the branch to be used in size()
+        columns     -- EventColumns object with the branches of the collection
+        sizeColumn  -- Name of the column to be used in size()
         objclass    -- Class to be used for the objects in __getitem__()
+        prefix      -- Prefix of the branches
+        flyweight   -- If True, __iter__() reuses a single object for all the indices
         """
         super(_Collection, self).__init__()
-        self._tree = tree
-        self._sizeBranch = sizeBranch
-        self._objclass = objclass
+        self._columns = columns
+        self._sizeColumn = sizeColumn
+        self._objclass = _objectClass(objclass, tuple(columns))
         self._prefix = prefix
+        self._flyweight = flyweight
+        self._members = None
 
     def size(self):
         """Number of objects in the collection."""
-        return int(getattr(self._tree, self._sizeBranch).size())
+        return len(self._columns[self._sizeColumn])
 
     def __len__(self):
         """Number of objects in the collection."""
@@ -36,44 +67,167 @@ class _Collection(object):
 
     def __getitem__(self, index):
         """Get object 'index' in the collection."""
-        return self._objclass(self._tree, index, self._prefix)
+        return self._objclass(self._columns, index, self._prefix)
 
     def __iter__(self):
-        """Returns generator for the objects."""
+        """Returns generator for the objects.
+
+        For flyweight collections the same object is moved along the
+        collection and yielded at every step, so references to it must
+        not be kept across iterations.
+        """
+        if not self._flyweight:
+            for index in range(self.size()):
+                yield self._objclass(self._columns, index, self._prefix)
+            return
+        cursor = self._objclass(self._columns, 0, self._prefix)
         for index in range(self.size()):
-            yield self._objclass(self._tree, index, self._prefix)
+            cursor._moveTo(index)
+            yield cursor
+
+    def members(self):
+        """Returns tuple of the names of the members with one value per object.
+
+        The columns of a prefix also include the branches of the longer
+        prefixes, some of which are separate collections (e.g. rechit_raw_*
+        for RecHits). Columns whose length differs from the size of the
+        collection are left out, and so are the columns of a longer prefix
+        which has a size column of its own of the same kind (e.g. raw_pt),
+        even if their length happens to match.
+        """
+        if self._members is None:
+            size = self.size()
+            sizeIsFlat = isinstance(self._columns[self._sizeColumn], np.ndarray)
+            other = set()
+            for member in self._columns:
+                parts = member.split("_")
+                for i in range(1, len(parts)):
+                    column = self._columns.get("_".join(parts[:i] + [self._sizeColumn]))
+                    if column is not None and isinstance(column, np.ndarray) == sizeIsFlat:
+                        other.add(member)
+                        break
+            self._members = tuple(member for member, column in self._columns.items()
+                                  if member not in other and len(column) == size)
+            # with the size column among the zipped ones, rows() gives
+            # exactly one row per object
+            assert self._sizeColumn in self._members
+        return self._members
+
+    def asSoA(self):
+        """Returns the columns of the collection as a dict of arrays, keyed by member name.
+
+        Only the members of the collection are included (see members()),
+        use Event.columns() for all the columns of the prefix.
+        """
+        return dict((member, self._columns[member]) for member in self.members())
+
+    def toNumpy(self, fields=None):
+        """Returns a dict of NumPy arrays with the given members (default: all the flat ones).
+
+        The arrays are views of the event columns, no copy is made. Only
+        flat members can be returned this way, use toAwkward() for the
+        nested ones (e.g. the hits of a SimCluster).
+        """
+        if fields is None:
+            fields = [field for field in self.members() if isinstance(self._columns[field], np.ndarray)]
+        return dict((field, np.asarray(self._columns[field])) for field in fields)
+
+    def toAwkward(self, fields=None):
+        """Returns an awkward Array with one record per object and the given members (default: all, see members())."""
+        if fields is None:
+            fields = self.members()
+        return ak.zip(dict((field, self._columns[field]) for field in fields), depth_limit=1)
+
+    def gather(self, field, indices):
+        """Returns member 'field' of a subset of the objects.
+
+        'indices' can be an array of object indices or a boolean mask of
+        the size of the collection. The selection is done in one NumPy
+        (or awkward, for nested members) call.
+        """
+        indices = np.asarray(indices)
+        if indices.dtype.kind not in "biu":
+            # e.g. an empty list, which NumPy makes a float64 array
+            indices = indices.astype(np.intp)
+        return self._columns[field][indices]
+
+    def numbaViews(self, fields=None):
+        """Returns a tuple of contiguous NumPy arrays with the given members.
+
+        The arrays can be passed as they are to numba-compiled kernels.
+        Without 'fields' the default members of the collection are used,
+        e.g. for RecHits (energy, x, y, z, layer):
+
+            @numba.njit(parallel=True)
+            def sumEnergy(energy, x, y, z, layer):
+                total = 0.
+                for i in numba.prange(len(energy)):
+                    total += energy[i]
+                return total
+
+            sumEnergy(*event.recHits().numbaViews())
+        """
+        if fields is None:
+            fields = self._numbaFields
+        return tuple(np.ascontiguousarray(self._columns[field]) for field in fields)
+
+    def rows(self):
+        """Returns generator for the objects as namedtuples of all their members (see members()).
+
+        The columns are zipped together in one pass, which is cheaper than
+        the object adaptors when most of the members are used.
+        """
+        fields = self.members()
+        key = (self._objclass.__name__, fields)
+        if key not in _rowClasses:
+            _rowClasses[key] = collections.namedtuple(self._objclass.__name__, fields, rename=True)
+        rowclass = _rowClasses[key]
+        for values in zip(*(self._columns[field] for field in fields)):
+            yield rowclass._make(values)
 
 
 class _Object(object):
     """Adaptor class representing a single object in a collection.
 
-    The member variables of the object are obtained from the branches
-    with common prefix and a given index.
+    The member variables of the object are obtained from the columns
+    of the branches with common prefix and a given index.
 
     Concrete object classes should inherit from this class.
     """
 
-    def __init__(self, tree, index, prefix):
+    __slots__ = ("_columns", "_index", "_prefix")
+
+    def __init__(self, columns, index, prefix):
         """Constructor.
 
         Arguments:
-        tree   -- TTree object
-        index  -- Index for this object
-        prefix -- Prefix of the branchs
+        columns -- EventColumns object with the branches of the collection
+        index   -- Index for this object
+        prefix  -- Prefix of the branchs
         """
         super(_Object, self).__init__()
-        self._tree = tree
+        self._columns = columns
         self._index = int(index)
         self._prefix = prefix
 
     def __getattr__(self, attr):
         """Return object member variable.
 
-        'attr' is translated as a branch in the TTree (<prefix>_<attr>).
+        'attr' is translated as a column of the branch <prefix>_<attr>.
         """
+        if attr.startswith("_"):
+            # unset slot or special method lookup, e.g. by copy or pickle
+            raise AttributeError(attr)
         self._checkIsValid()
-        val = getattr(self._tree, self._prefix + "_" + attr)[self._index]
-        return lambda: val
+        try:
+            column = self._columns[attr]
+        except KeyError:
+            raise AttributeError("%s has no branch %s_%s" % (self.__class__.__name__, self._prefix, attr))
+        return column[self._index]
+
+    def _moveTo(self, index):
+        """Point the object to another index."""
+        self._index = int(index)
 
     def _checkIsValid(self):
         """Raise an exception if the object index is not valid."""
@@ -89,10 +243,163 @@ class _Object(object):
         return self._index
 
 
+class _Field(object):
+    """Descriptor returning a member of an object from its column.
+
+    Members looked up through a _Field skip the failed normal attribute
+    lookup and the call of _Object.__getattr__() made for every access.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name):
+        """Constructor.
+
+        Arguments:
+        name -- Member name, i.e. the key of the column in the EventColumns object
+        """
+        super(_Field, self).__init__()
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj._index == -1:
+            obj._checkIsValid()
+        return obj._columns[self._name][obj._index]
+
+
+def _objectClass(objclass, fields):
+    """Returns subclass of 'objclass' with a _Field for each of the given members.
+
+    The classes are built once per object class and set of members, so
+    they are shared by the collections of all the events. Members which
+    would hide an attribute of 'objclass' (e.g. index) are left to
+    _Object.__getattr__().
+
+    The objects of a collection are thus instances of a subclass, so
+    isinstance(obj, RecHit) holds but type(obj) is RecHit does not.
+    They are pickled as plain 'objclass' objects.
+    """
+    key = (objclass, fields)
+    if key not in _objectClasses:
+        attrs = dict((field, _Field(field)) for field in fields
+                     if not field.startswith("_") and not hasattr(objclass, field))
+        attrs["__slots__"] = ()
+        attrs["__module__"] = objclass.__module__
+        attrs["__qualname__"] = "%s._Fields%d" % (objclass.__name__, len(_objectClasses))
+        attrs["__reduce__"] = _reduceObject
+        _objectClasses[key] = type(objclass.__name__, (objclass,), attrs)
+    return _objectClasses[key]
+
+
+def _reduceObject(obj):
+    """__reduce__() of the classes from _objectClass(), rebuilding the object as its base class."""
+    return (type(obj).__bases__[0], (obj._columns, obj._index, obj._prefix))
+
+
+#-------------------------------------------------------------------------------------
+class _Batch(object):
+    """Block of consecutive entries read in one go with uproot.
+
+    Jagged branches are flattened once per block, so that the column of a
+    single entry is a NumPy view between two offsets. Branches with more
+    than one level of nesting are always kept as awkward arrays.
+    """
+
+    __slots__ = ("_arrays", "_start", "_castSchema", "_fields", "_flat")
+
+    def __init__(self, arrays, start, castSchema):
+        """Constructor.
+
+        Arguments:
+        arrays     -- awkward Array with one field per branch
+        start      -- Entry number of the first entry in the block
+        castSchema -- dict of the dtypes the flat branches are cast to, keyed by branch name
+        """
+        super(_Batch, self).__init__()
+        self._arrays = arrays
+        self._start = start
+        self._castSchema = castSchema
+        self._fields = frozenset(arrays.fields)
+        self._flat = {}
+
+    @classmethod
+    def read(cls, tree, branches, entry, castSchema):
+        """Returns a block with the given branches of a single entry."""
+        arrays = tree.arrays(filter_name=branches, entry_start=entry, entry_stop=entry + 1, library="ak")
+        return cls(arrays, entry, castSchema)
+
+    def start(self):
+        """Entry number of the first entry in the block."""
+        return self._start
+
+    def stop(self):
+        """Entry number following the last entry in the block."""
+        return self._start + len(self._arrays)
+
+    def hasBranches(self, branches):
+        """Check if all the given branches were read in the block."""
+        return self._fields.issuperset(branches)
+
+    def value(self, branch, index):
+        """Returns the value of the scalar 'branch' for entry 'index' of the block."""
+        return self._arrays[branch][index]
+
+    def column(self, branch, index):
+        """Returns the column of 'branch' for entry 'index' of the block."""
+        if branch not in self._flat:
+            array = self._arrays[branch]
+            content, offsets = array, None
+            # decide from the type, not the data: a vector<vector<float>>
+            # block whose inner lists happen to have the same length must
+            # not become a 2D ndarray
+            if array.ndim == 2:
+                try:
+                    content = ak.to_numpy(ak.flatten(array))
+                except ValueError:
+                    # not numbers, e.g. strings
+                    pass
+                else:
+                    if branch in self._castSchema:
+                        content = content.astype(self._castSchema[branch], copy=False)
+                    offsets = np.zeros(len(array) + 1, dtype=np.int64)
+                    np.cumsum(ak.to_numpy(ak.num(array)), out=offsets[1:])
+            self._flat[branch] = (content, offsets)
+        content, offsets = self._flat[branch]
+        if offsets is None:
+            return content[index]
+        return content[offsets[index]:offsets[index + 1]]
+
+
+#-------------------------------------------------------------------------------------
+class EventColumns(dict):
+    """Columns of all the branches with a common prefix for a single event.
+
+    The columns are taken from a block of entries read with uproot and
+    keyed by the branch name without the '<prefix>_' part, so that the
+    objects of a collection only need to index into them.
+    """
+
+    def __init__(self, batch, branches, index):
+        """Constructor.
+
+        Arguments:
+        batch    -- _Batch object holding the event
+        branches -- dict of the branch names with the prefix, keyed by member name
+        index    -- Index of the event inside the block
+        """
+        super(EventColumns, self).__init__((member, batch.column(branch, index)) for member, branch in branches.items())
+
+
 #-------------------------------------------------------------------------------------
 class HGCalNtuple(object):
     """Class abstracting the whole ntuple/TTree.
 
+    Ntuples stored as an RNTuple instead of a TTree are read the same way,
+    since uproot gives the same columns for both. ROOT is then not used
+    for reading at all, and tree() returns None.
+
     Main benefit is to provide nice interface for
     - iterating over events
     - querying whether hit/seed information exists
@@ -101,51 +408,237 @@ class HGCalNtuple(object):
     itertools.izip() instead.
     """
 
-    def __init__(self, fileName, tree):
+    # Smallest dtypes holding the values of the flat branches, used for
+    # their columns to halve (or quarter) the memory traffic of the
+    # analysis code. Branches not listed keep the type stored in the file.
+    castSchema = {
+        "rechit_energy": np.float32,
+        "rechit_x": np.float32,
+        "rechit_y": np.float32,
+        "rechit_z": np.float32,
+        "rechit_layer": np.int8,
+        "rechit_wafer_u": np.int8,
+        "rechit_wafer_v": np.int8,
+        "rechit_cell_u": np.int8,
+        "rechit_cell_v": np.int8,
+        "rechit_raw_energy": np.float32,
+        "rechit_raw_x": np.float32,
+        "rechit_raw_y": np.float32,
+        "rechit_raw_z": np.float32,
+        "rechit_raw_layer": np.int8,
+        "rechit_raw_wafer_u": np.int8,
+        "rechit_raw_wafer_v": np.int8,
+        "rechit_raw_cell_u": np.int8,
+        "rechit_raw_cell_v": np.int8,
+        "layerCluster_energy": np.float32,
+        "layerCluster_x": np.float32,
+        "layerCluster_y": np.float32,
+        "layerCluster_z": np.float32,
+        "layerCluster_layer": np.int8,
+    }
+
+    # branches still read through ROOT, for Event.run()/lumi()/event(),
+    # or along with the other branches for an RNTuple
+    _eventBranches = ("run", "lumi", "event")
+
+    def __init__(self, fileName, tree, prefixes=("rechit", "layerCluster", "simcluster", "trackster"), stepSize="100 MB",
+                 decompressionWorkers=8):
         """Constructor.
 
         Arguments:
-        fileName -- String for path to the ROOT file
-        tree     -- Name of the TTree object inside the ROOT file (default: 'ana/hgc')
+        fileName             -- String for path to the ROOT file
+        tree                 -- Name of the TTree or RNTuple object inside the ROOT file (default: 'ana/hgc')
+        prefixes             -- Prefixes of the branches read in blocks when iterating over the events
+        stepSize             -- Size of the blocks, as a number of entries or a string with memory units
+        decompressionWorkers -- Number of threads decompressing the blocks (0 or None: decompress serially)
         """
         super(HGCalNtuple, self).__init__()
+        self._fileName = fileName
+        self._treeName = tree
         self._file = ROOT.TFile.Open(fileName)
-        self._tree = self._file.Get(tree)
-        self._entries = self._tree.GetEntriesFast()
+        self._uprootFile = uproot.open(fileName)
+        self._uprootTree = self._uprootFile[tree]
+        self._stepSize = stepSize
+        # decompress the baskets of a block in parallel, with a bounded
+        # number of threads since the number of CPUs of the host may be
+        # much larger than the job slot; shut down by close()
+        self._executor = None
+        if decompressionWorkers:
+            self._executor = uproot.ThreadPoolExecutor(decompressionWorkers)
+        if self._uprootTree.classname.endswith("RNTuple"):
+            self._tree = None
+            self._entries = self._uprootTree.num_entries
+            names = self._uprootTree.keys()
+        else:
+            self._tree = self._file.Get(tree)
+            self._entries = self._tree.GetEntriesFast()
+            # prefetch the baskets of the branches ROOT reads, instead of
+            # one small read per branch and entry
+            self._tree.SetCacheSize(100 * 1024 * 1024)
+            names = [branch.GetName() for branch in self._tree.GetListOfBranches()]
+
+        # the branch names are the same for all the events, so group them
+        # once by every possible prefix, e.g. rechit_raw_pt is listed under
+        # both 'rechit' (as raw_pt) and 'rechit_raw' (as pt)
+        self._branchesByPrefix = collections.defaultdict(dict)
+        for name in names:
+            parts = name.split("_")
+            for i in range(1, len(parts)):
+                self._branchesByPrefix["_".join(parts[:i])]["_".join(parts[i:])] = name
+
+        self.enable(prefixes)
+
+    def close(self):
+        """Stops the decompression threads and closes the file."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._uprootFile.close()
+        self._file.Close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def file(self):
         return self._file
 
     def tree(self):
+        """Returns the ROOT TTree, or None for an RNTuple.
+
+        Only the event id branches are switched on, call
+        tree().SetBranchStatus("*", 1) before reading other branches
+        through PyROOT.
+        """
         return self._tree
 
+    def uprootTree(self):
+        return self._uprootTree
+
+    def branches(self, prefix):
+        """Returns dict of the branch names with a given prefix, keyed by member name."""
+        return self._branchesByPrefix.get(prefix, {})
+
     def nevents(self):
         return self._entries
 
+    def isRNTuple(self):
+        """Returns true if the ntuple is stored as an RNTuple."""
+        return self._tree is None
+
+    def enabledBranches(self, prefixes=()):
+        """Returns list of the branch names with the enabled prefixes and the given extra ones.
+
+        For an RNTuple the event id branches are included as well.
+        """
+        prefixes = self._prefixes + tuple(p for p in prefixes if p not in self._prefixes)
+        names = [name for prefix in prefixes for name in self.branches(prefix).values()]
+        if self.isRNTuple():
+            names.extend(self._eventBranches)
+        return names
+
+    def enable(self, prefixes):
+        """Select the prefixes of the branches read when iterating over the events.
+
+        Must be called before iterating. The <prefix>_* branches are read
+        in blocks with uproot, while ROOT's GetEntry() only reads the event
+        id branches; everything else is skipped. Other prefixes can still
+        be accessed, at the cost of one extra read per event.
+        """
+        self._prefixes = tuple(prefixes)
+        if self.isRNTuple():
+            return
+        self._tree.SetBranchStatus("*", 0)
+        self._tree.DropBranchFromCache("*", True)
+        for name in self._eventBranches:
+            self._tree.SetBranchStatus(name, 1)
+            self._tree.AddBranchToCache(name, True)
+        self._tree.StopCacheLearningPhase()
+
     def hasRawRecHits(self):
         """Returns true if the ntuple has raw RecHit information."""
-        return hasattr(self._tree, "rechit_raw_pt")
+        return "pt" in self.branches("rechit_raw")
 
     def __iter__(self):
         """Returns generator for iterating over TTree entries (events)
 
         Generator returns Event objects.
 
+        The branches with the prefixes given in the constructor are
+        read by uproot in blocks of entries, which the events index into.
+        """
+        return self._events()
+
+    def _events(self, start=None, stop=None):
+        """Returns generator for the events in the entry range [start, stop)."""
+        for arrays, report in self._uprootTree.iterate(filter_name=self.enabledBranches(), library="ak", step_size=self._stepSize,
+                                                       entry_start=start, entry_stop=stop,
+                                                       decompression_executor=self._executor, report=True):
+            batch = _Batch(arrays, report.tree_entry_start, self.castSchema)
+            for jentry in range(batch.start(), batch.stop()):
+                if self.isRNTuple():
+                    yield Event(self, jentry, batch)
+                    continue
+                # get the next tree in the chain and verify
+                ientry = self._tree.LoadTree(jentry)
+                if ientry < 0:
+                    return
+                # copy next entry into memory and verify
+                nb = self._tree.GetEntry(jentry)
+                if nb <= 0:
+                    continue
+
+                yield Event(self, jentry, batch)
+
+    def map(self, fn, nproc=None):
+        """Applies a function to all the events in parallel processes.
+
+        The entries are split in 'nproc' contiguous ranges, each one
+        processed by a worker process with its own HGCalNtuple on the same
+        file, with the same prefixes and castSchema, and without
+        decompression threads. The values returned by fn for the events
+        are concatenated into a single NumPy array, in the order of the
+        events; events for which fn returns an empty array do not
+        contribute. The decompression threads of this ntuple are stopped
+        while the worker processes run, so that they are not forked.
+
+        Arguments:
+        fn    -- Function taking an Event, must be picklable (i.e. defined at module level)
+        nproc -- Number of worker processes (default: number of CPUs)
         """
-        for jentry in range(self._entries):
-            # get the next tree in the chain and verify
-            ientry = self._tree.LoadTree(jentry)
-            if ientry < 0:
-                break
-            # copy next entry into memory and verify
-            nb = self._tree.GetEntry(jentry)
-            if nb <= 0:
-                continue
-
-            yield Event(self._tree, jentry)
+        if nproc is None:
+            nproc = multiprocessing.cpu_count()
+        nproc = max(1, min(nproc, self._entries))
+        bounds = [self._entries * i // nproc for i in range(nproc + 1)]
+        tasks = [(self._fileName, self._treeName, self._prefixes, self._stepSize, self.castSchema, fn, start, stop)
+                 for start, stop in zip(bounds[:-1], bounds[1:])]
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown()
+            self._executor = None
+        try:
+            pool = multiprocessing.Pool(nproc)
+            try:
+                results = pool.map(_mapRange, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            if executor is not None:
+                self._executor = uproot.ThreadPoolExecutor(executor.max_workers)
+        results = [result for result in results if result is not None]
+        if not results:
+            return np.empty(0)
+        return np.concatenate(results)
 
     def getEvent(self, index):
         """Returns Event for a given index"""
+        if self.isRNTuple():
+            if index < 0 or index >= self._entries:
+                return None
+            return Event(self, index)
         ientry = self._tree.LoadTree(index)
         if ientry < 0:
             return None
@@ -153,7 +646,7 @@ class HGCalNtuple(object):
         if nb <= 0:
             None
 
-        return Event(self._tree, ientry)  # ientry of jentry?
+        return Event(self, ientry)  # ientry of jentry?
 
 
 #-------------------------------------------------------------------------------------
@@ -164,179 +657,263 @@ class Event(object):
     or collections of objects.
     """
 
-    def __init__(self, tree, entry):
+    __slots__ = ("_ntuple", "_tree", "_entry", "_batch", "_columns")
+
+    def __init__(self, ntuple, entry, batch=None):
         """Constructor.
 
         Arguments:
-        tree  -- TTree object
-        entry -- Entry number in the tree
+        ntuple -- HGCalNtuple object
+        entry  -- Entry number in the tree
+        batch  -- _Batch object holding the entry, if already read
         """
         super(Event, self).__init__()
-        self._tree = tree
+        self._ntuple = ntuple
+        self._tree = ntuple.tree()
         self._entry = entry
+        self._batch = batch
+        self._columns = {}
 
     def entry(self):
         return self._entry
 
+    def _eventBranch(self, name):
+        """Returns the value of an event id branch."""
+        if self._tree is not None:
+            return getattr(self._tree, name)
+        return self._readBatch().value(name, self._entry - self._batch.start())
+
     def event(self):
         """Returns event number."""
-        return self._tree.event
+        return self._eventBranch("event")
 
     def lumi(self):
         """Returns lumisection number."""
-        return self._tree.lumi
+        return self._eventBranch("lumi")
 
     def run(self):
         """Returns run number."""
-        return self._tree.run
+        return self._eventBranch("run")
 
     def eventId(self):
         """Returns (run, lumi, event) tuple."""
-        return (self._tree.run, self._tree.lumi, self._tree.event)
+        return (self.run(), self.lumi(), self.event())
+
+    def _readBatch(self, prefixes=()):
+        """Returns the block holding the event, reading the enabled branches for it if needed."""
+        if self._batch is None:
+            self._batch = _Batch.read(self._ntuple.uprootTree(), self._ntuple.enabledBranches(prefixes),
+                                      self._entry, self._ntuple.castSchema)
+        return self._batch
 
     def eventIdStr(self):
         """Returns 'run:lumi:event' string."""
         return "%d:%d:%d" % self.eventId()
 
-    def recHits(self, prefix="rechit"):
+    def columns(self, prefix):
+        """Returns EventColumns object for the branches with a given prefix.
+
+        The columns come from the block of entries read while iterating
+        over the ntuple. Branches which are not part of it are read for
+        this event only, once per prefix. Events not read while iterating
+        (see HGCalNtuple.getEvent()) read the branches of all the enabled
+        prefixes on first use, and share them between the prefixes.
+        """
+        if prefix not in self._columns:
+            branches = self._ntuple.branches(prefix)
+            batch = self._readBatch((prefix,))
+            if not batch.hasBranches(branches.values()):
+                batch = _Batch.read(self._ntuple.uprootTree(), list(branches.values()), self._entry, self._ntuple.castSchema)
+            self._columns[prefix] = EventColumns(batch, branches, self._entry - batch.start())
+        return self._columns[prefix]
+
+    def recHits(self, prefix="rechit", flyweight=False):
         """Returns RecHits object."""
-        return RecHits(self._tree, prefix)
+        return RecHits(self.columns(prefix), prefix, flyweight)
 
-    def layerClusters(self, prefix="layerCluster"):
+    def layerClusters(self, prefix="layerCluster", flyweight=False):
         """Returns LayerClusters object."""
-        return LayerClusters(self._tree, prefix)
+        return LayerClusters(self.columns(prefix), prefix, flyweight)
 
-    def simClusters(self, prefix="simcluster"):
+    def simClusters(self, prefix="simcluster", flyweight=False):
         """Returns SimClusters object."""
-        return SimClusters(self._tree, prefix)
+        return SimClusters(self.columns(prefix), prefix, flyweight)
 
-    def tracksters(self, prefix="trackster"):
+    def tracksters(self, prefix="trackster", flyweight=False):
         """Returns Tracksters object."""
-        return Tracksters(self._tree, prefix)
+        return Tracksters(self.columns(prefix), prefix, flyweight)
 
     def getDataFrame(self, prefix):
-        branches = [br.GetName() for br in self._tree.GetListOfBranches() if br.GetName().startswith(prefix+'_')]
-        names = ['_'.join(br.split('_')[1:]) for br in branches]
-        nd_array = self._tree.AsMatrix()
-        df = pd.DataFrame()
-        for idx in range(0, len(branches)):
-            df[names[idx]] = nd_array[branches[idx]][0]
-        return df
+        """Returns a DataFrame with one row per object and one column per member of the collection.
+
+        The members are those of the collection of the prefix (see
+        _Collection.members()), e.g. the rechit_raw_* branches are not
+        part of the DataFrame for 'rechit'. Nested branches give object
+        columns with the per-object arrays.
+        """
+        columns = self.columns(prefix)
+        collclass = _collectionClasses.get(prefix.split("_")[0])
+        if collclass is None:
+            collection = _Collection(columns, "pt", _Object, prefix)
+        else:
+            collection = collclass(columns, prefix)
+        data = {}
+        for member in collection.members():
+            column = columns[member]
+            if not isinstance(column, np.ndarray) or column.ndim > 1:
+                column = list(column)
+            data[member] = column
+        return pd.DataFrame(data, copy=False)
 
 
 #-------------------------------------------------------------------------------------
 class RecHit(_Object):
     """Class representing a RecHit."""
 
-    def __init__(self, tree, index, prefix):
+    __slots__ = ()
+
+    def __init__(self, columns, index, prefix):
         """Constructor.
 
         Arguments:
-        tree    -- TTree object
+        columns -- EventColumns object
         index   -- Index of the RecHit
         prefix -- TBranch prefix
         """
-        super(RecHit, self).__init__(tree, index, prefix)
+        super(RecHit, self).__init__(columns, index, prefix)
 
     # def __getattr__(self, attr):
     #     """Custom __getattr__ because of the second index needed to access the branch."""
-    #     val = super(SimHitMatchInfo, self).__getattr__(attr)()[self._shindex]
-    #     return lambda: val
+    #     return super(SimHitMatchInfo, self).__getattr__(attr)[self._shindex]
 
 
 class RecHits(_Collection):
     """Class presenting a collection of RecHits."""
 
-    def __init__(self, tree, prefix):
+    __slots__ = ()
+
+    _numbaFields = ("energy", "x", "y", "z", "layer")
+
+    def __init__(self, columns, prefix, flyweight=False):
         """Constructor.
 
         Arguments:
-        tree -- TTree object
+        columns -- EventColumns object
         prefix -- TBranch prefix
+        flyweight -- If True, iterating reuses a single RecHit object
         """
-        super(RecHits, self).__init__(tree, prefix + "_pt", RecHit, prefix)
+        super(RecHits, self).__init__(columns, "pt", RecHit, prefix, flyweight)
 
 
 #-------------------------------------------------------------------------------------
 class SimCluster(_Object):
     """Class representing a SimCluster."""
 
-    def __init__(self, tree, index, prefix):
+    __slots__ = ()
+
+    def __init__(self, columns, index, prefix):
         """Constructor.
 
         Arguments:
-        tree    -- TTree object
+        columns -- EventColumns object
         index   -- Index of the SimCluster
         prefix -- TBranch prefix
         """
-        super(SimCluster, self).__init__(tree, index, prefix)
+        super(SimCluster, self).__init__(columns, index, prefix)
 
 
 class SimClusters(_Collection):
     """Class presenting a collection of SimClusters."""
 
-    def __init__(self, tree, prefix):
+    __slots__ = ()
+
+    _numbaFields = ("energy", "pt", "eta", "phi")
+
+    def __init__(self, columns, prefix, flyweight=False):
         """Constructor.
 
         Arguments:
-        tree -- TTree object
+        columns -- EventColumns object
         prefix -- TBranch prefix
+        flyweight -- If True, iterating reuses a single SimCluster object
         """
-        super(SimClusters, self).__init__(tree, prefix + "_pt", SimCluster, prefix)
+        super(SimClusters, self).__init__(columns, "pt", SimCluster, prefix, flyweight)
 
 
 #-------------------------------------------------------------------------------------
 class LayerCluster(_Object):
     """Class representing a LayerCluster."""
 
-    def __init__(self, tree, index, prefix):
+    __slots__ = ()
+
+    def __init__(self, columns, index, prefix):
         """Constructor.
 
         Arguments:
-        tree    -- TTree object
+        columns -- EventColumns object
         index   -- Index of the LayerCluster
         prefix -- TBranch prefix
         """
-        super(LayerCluster, self).__init__(tree, index, prefix)
+        super(LayerCluster, self).__init__(columns, index, prefix)
 
 
 class LayerClusters(_Collection):
     """Class presenting a collection of LayerClusters."""
 
-    def __init__(self, tree, prefix):
+    __slots__ = ()
+
+    _numbaFields = ("energy", "x", "y", "z", "layer")
+
+    def __init__(self, columns, prefix, flyweight=False):
         """Constructor.
 
         Arguments:
-        tree -- TTree object
+        columns -- EventColumns object
         prefix -- TBranch prefix
+        flyweight -- If True, iterating reuses a single LayerCluster object
         """
-        super(LayerClusters, self).__init__(tree, prefix + "_pt", LayerCluster, prefix)
+        super(LayerClusters, self).__init__(columns, "pt", LayerCluster, prefix, flyweight)
 
 #-------------------------------------------------------------------------------------
 class Trackster(_Object):
     """Class representing a Trackster."""
 
-    def __init__(self, tree, index, prefix):
+    __slots__ = ()
+
+    def __init__(self, columns, index, prefix):
         """Constructor.
 
         Arguments:
-        tree    -- TTree object
+        columns -- EventColumns object
         index   -- Index of the Trackster
         prefix -- TBranch prefix
         """
-        super(Trackster, self).__init__(tree, index, prefix)
+        super(Trackster, self).__init__(columns, index, prefix)
 
 
 class Tracksters(_Collection):
     """Class presenting a collection of Tracksters."""
 
-    def __init__(self, tree, prefix):
+    __slots__ = ()
+
+    _numbaFields = ("raw_energy", "x", "y", "z", "eta", "phi")
+
+    def __init__(self, columns, prefix, flyweight=False):
         """Constructor.
 
         Arguments:
-        tree -- TTree object
+        columns -- EventColumns object
         prefix -- TBranch prefix
+        flyweight -- If True, iterating reuses a single Trackster object
         """
-        super(Tracksters, self).__init__(tree, prefix + "_Id", Trackster, prefix)
+        super(Tracksters, self).__init__(columns, "Id", Trackster, prefix, flyweight)
 
 
+# collection classes of the prefixes, used by Event.getDataFrame(); longer
+# prefixes (e.g. rechit_raw) use the class of their first part
+_collectionClasses = {
+    "rechit": RecHits,
+    "layerCluster": LayerClusters,
+    "simcluster": SimClusters,
+    "trackster": Tracksters,
+}
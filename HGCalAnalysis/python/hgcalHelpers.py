@@ -23,81 +23,81 @@ def analyzeSimClusters(ntuple,tree,maxEvents,outDir,output,verbosityLevel):
         #if currentevent % 100 != 0 : continue
         if (verbosityLevel>=1 and currentevent % 100 == 0): print( "\nCurrent event: ", currentevent)
 
-        simClusters = event.simClusters()
+        simClusters = event.simClusters(flyweight=True)
         
         for simClusIndex, simClus in enumerate(simClusters):
-            for DetId in simClus.hits():
+            for DetId in simClus.hits:
                 out["sClusHits"].append(DetId)
                 out["EventId"].append(currentevent)
                 out["EventIdFromFile"].append(event.event())
                 out["sClusIndex"].append(simClusIndex)
                 #Fill the per Object variables but per hit to produce the dataframe
-                out["pdgId"].append(simClus.pdgId())
-                out["id"].append(simClus.id())
-                out["particleId"].append(simClus.particleId())
-                out["charge"].append(simClus.charge())
-                out["simcluster_p"].append(simClus.simcluster_p())
-                out["energy"].append(simClus.energy())
-                out["et"].append(simClus.et())
-                out["mass"].append(simClus.mass())
-                out["mt"].append(simClus.mt())
-                out["pt"].append(simClus.pt())
-                out["phi"].append(simClus.phi())
-                out["theta"].append(simClus.theta())
-                out["eta"].append(simClus.eta())
-                out["rapidity"].append(simClus.rapidity())
-                out["status"].append(simClus.status())
-                #out["longLived"].append(simClus.longLived())
-                out["longLived"].append( int(simClus.longLived() == True) )
-                out["numberOfSimHits"].append(simClus.numberOfSimHits())
-                out["simEnergy"].append(simClus.simEnergy())
-            for rh in simClus.rechit_eta():
+                out["pdgId"].append(simClus.pdgId)
+                out["id"].append(simClus.id)
+                out["particleId"].append(simClus.particleId)
+                out["charge"].append(simClus.charge)
+                out["simcluster_p"].append(simClus.simcluster_p)
+                out["energy"].append(simClus.energy)
+                out["et"].append(simClus.et)
+                out["mass"].append(simClus.mass)
+                out["mt"].append(simClus.mt)
+                out["pt"].append(simClus.pt)
+                out["phi"].append(simClus.phi)
+                out["theta"].append(simClus.theta)
+                out["eta"].append(simClus.eta)
+                out["rapidity"].append(simClus.rapidity)
+                out["status"].append(simClus.status)
+                #out["longLived"].append(simClus.longLived)
+                out["longLived"].append( int(simClus.longLived == True) )
+                out["numberOfSimHits"].append(simClus.numberOfSimHits)
+                out["simEnergy"].append(simClus.simEnergy)
+            for rh in simClus.rechit_eta:
                 out["rechit_eta"].append(rh)
-            for rh in simClus.rechit_phi():
+            for rh in simClus.rechit_phi:
                 out["rechit_phi"].append(rh)
-            for rh in simClus.rechit_pt():
+            for rh in simClus.rechit_pt:
                 out["rechit_pt"].append(rh)
-            for rh in simClus.rechit_energy():
+            for rh in simClus.rechit_energy:
                 out["rechit_energy"].append(rh)
-            for rh in simClus.rechit_uncalib_energy():
+            for rh in simClus.rechit_uncalib_energy:
                 out["rechit_uncalib_energy"].append(rh)
-            for rh in simClus.rechit_recostructable_energy():
+            for rh in simClus.rechit_recostructable_energy:
                 out["rechit_recostructable_energy"].append(rh)
-            for rh in simClus.rechit_matbudget():  
+            for rh in simClus.rechit_matbudget:  
                 out["rechit_matbudget"].append(rh)
-            for rh in simClus.rechit_SoN():
+            for rh in simClus.rechit_SoN:
                 out["rechit_SoN"].append(rh)
-            for rh in simClus.rechit_x():
+            for rh in simClus.rechit_x:
                 out["rechit_x"].append(rh)
-            for rh in simClus.rechit_y():
+            for rh in simClus.rechit_y:
                 out["rechit_y"].append(rh)
-            for rh in simClus.rechit_z():
+            for rh in simClus.rechit_z:
                 out["rechit_z"].append(rh)
-            for rh in simClus.rechit_time():
+            for rh in simClus.rechit_time:
                 out["rechit_time"].append(rh)
-            for rh in simClus.rechit_simclusterid():
+            for rh in simClus.rechit_simclusterid:
                 out["rechit_simclusterid"].append(rh)
-            for DetId in simClus.matched_hits():
+            for DetId in simClus.matched_hits:
                 out["sClusMatchedHits"].append(DetId)
-            for thick in simClus.hits_thickness():
+            for thick in simClus.hits_thickness:
                 out["sClusHitsThick"].append(thick)
-            for det in simClus.hits_dets():
+            for det in simClus.hits_dets:
                 out["sClusHitsDet"].append(det)        
-            for frac in simClus.fractions():
+            for frac in simClus.fractions:
                 out["sClusHitsFractions"].append(frac)
-            for layer in simClus.layers():
+            for layer in simClus.layers:
                 out["sClusHitsLayers"].append(layer)
-            for wafer_u in simClus.wafers_u():
+            for wafer_u in simClus.wafers_u:
                 out["wafer_u"].append(wafer_u)
-            for wafer_v in simClus.wafers_v():
+            for wafer_v in simClus.wafers_v:
                 out["wafer_v"].append(wafer_v)
-            for cell_u in simClus.cells_u():
+            for cell_u in simClus.cells_u:
                 out["cell_u"].append(cell_u)
-            for cell_v in simClus.cells_v():
+            for cell_v in simClus.cells_v:
                 out["cell_v"].append(cell_v)
-            for cell_type in simClus.cells_type():
+            for cell_type in simClus.cells_type:
                 out["cell_type"].append(cell_type)
-            for cell_zside in simClus.cells_zside():
+            for cell_zside in simClus.cells_zside:
                 out["cell_zside"].append(cell_zside)
     
     #---------------------------------------------------------------------------------------------------
@@ -145,79 +145,79 @@ def analyzeLayerClusters(ntuple,tree,maxEvents,outDir,output,GenEnergy,verbosity
         if event.entry() >= maxEvents and maxEvents != -1 : break
         if (verbosityLevel>=1 and currentevent % 1 == 0): print( "\nCurrent event: ", currentevent)
 
-        layerClusters = event.layerClusters()
+        layerClusters = event.layerClusters(flyweight=True)
         
         for layClusIndex, layClus in enumerate(layerClusters):
             outLC["EventId"].append(currentevent)
             outLC["EventIdFromFile"].append(event.event())
-            outLC["id"].append(layClus.id())
-            outLC["trackster_id"].append(layClus.trackster_id())
-            outLC["eta"].append(layClus.eta())
-            outLC["phi"].append(layClus.phi())
-            outLC["pt"].append(layClus.pt())
-            outLC["energy"].append(layClus.energy())
-            outLC["x"].append(layClus.x())
-            outLC["y"].append(layClus.y())
-            outLC["z"].append(layClus.z())
-            outLC["layer"].append(layClus.layer())
-            outLC["nhitCore"].append(layClus.nhitCore())
-            outLC["nhitAll"].append(layClus.nhitAll())
-            outLC["matbudget"].append(layClus.matbudget())
-            outLC["rechitSeed"].append(layClus.rechitSeed())
-            for DetId in layClus.rechit_detid():
+            outLC["id"].append(layClus.id)
+            outLC["trackster_id"].append(layClus.trackster_id)
+            outLC["eta"].append(layClus.eta)
+            outLC["phi"].append(layClus.phi)
+            outLC["pt"].append(layClus.pt)
+            outLC["energy"].append(layClus.energy)
+            outLC["x"].append(layClus.x)
+            outLC["y"].append(layClus.y)
+            outLC["z"].append(layClus.z)
+            outLC["layer"].append(layClus.layer)
+            outLC["nhitCore"].append(layClus.nhitCore)
+            outLC["nhitAll"].append(layClus.nhitAll)
+            outLC["matbudget"].append(layClus.matbudget)
+            outLC["rechitSeed"].append(layClus.rechitSeed)
+            for DetId in layClus.rechit_detid:
                 out["lClusHits"].append(DetId)
                 out["EventId"].append(currentevent)
                 out["EventIdFromFile"].append(event.event())
-                out["id"].append(layClus.id())
-                out["trackster_id"].append(layClus.trackster_id())
-                out["eta"].append(layClus.eta())
-                out["phi"].append(layClus.phi())
-                out["pt"].append(layClus.pt())
-                out["energy"].append(layClus.energy())
-                out["x"].append(layClus.x())
-                out["y"].append(layClus.y())
-                out["z"].append(layClus.z())
-                out["layer"].append(layClus.layer())
-                out["nhitCore"].append(layClus.nhitCore())
-                out["nhitAll"].append(layClus.nhitAll())
-                out["rechitSeed"].append(layClus.rechitSeed())
-            for rh in layClus.rechit_eta():
+                out["id"].append(layClus.id)
+                out["trackster_id"].append(layClus.trackster_id)
+                out["eta"].append(layClus.eta)
+                out["phi"].append(layClus.phi)
+                out["pt"].append(layClus.pt)
+                out["energy"].append(layClus.energy)
+                out["x"].append(layClus.x)
+                out["y"].append(layClus.y)
+                out["z"].append(layClus.z)
+                out["layer"].append(layClus.layer)
+                out["nhitCore"].append(layClus.nhitCore)
+                out["nhitAll"].append(layClus.nhitAll)
+                out["rechitSeed"].append(layClus.rechitSeed)
+            for rh in layClus.rechit_eta:
                 out["rechit_eta"].append(rh)
-            for rh in layClus.rechit_phi():
+            for rh in layClus.rechit_phi:
                 out["rechit_phi"].append(rh)
-            for rh in layClus.rechit_pt():
+            for rh in layClus.rechit_pt:
                 out["rechit_pt"].append(rh)
-            for rh in layClus.rechit_energy():
+            for rh in layClus.rechit_energy:
                 out["rechit_energy"].append(rh)
-            for rh in layClus.rechit_uncalib_energy():
+            for rh in layClus.rechit_uncalib_energy:
                 out["rechit_uncalib_energy"].append(rh)
-            for rh in layClus.rechit_x():
+            for rh in layClus.rechit_x:
                 out["rechit_x"].append(rh)
-            for rh in layClus.rechit_y():
+            for rh in layClus.rechit_y:
                 out["rechit_y"].append(rh)
-            for rh in layClus.rechit_z():
+            for rh in layClus.rechit_z:
                 out["rechit_z"].append(rh)
-            for rh in layClus.rechit_time():
+            for rh in layClus.rechit_time:
                 out["rechit_time"].append(rh)
-            for rh in layClus.rechit_thickness():
+            for rh in layClus.rechit_thickness:
                 out["rechit_thickness"].append(rh)
-            for rh in layClus.rechit_layer():
+            for rh in layClus.rechit_layer:
                 out["rechit_layer"].append(rh)
-            for rh in layClus.rechit_wafer_u():
+            for rh in layClus.rechit_wafer_u:
                 out["rechit_wafer_u"].append(rh)
-            for rh in layClus.rechit_wafer_v():
+            for rh in layClus.rechit_wafer_v:
                 out["rechit_wafer_v"].append(rh)
-            for rh in layClus.rechit_cell_u():
+            for rh in layClus.rechit_cell_u:
                 out["rechit_cell_u"].append(rh)
-            for rh in layClus.rechit_cell_v():
+            for rh in layClus.rechit_cell_v:
                 out["rechit_cell_v"].append(rh)
-            #for rh in layClus.rechit_isHalf():
+            #for rh in layClus.rechit_isHalf:
             #    out["rechit_isHalf"].append(rh)
-            for rh in layClus.rechit_flags():
+            for rh in layClus.rechit_flags:
                 out["rechit_flags"].append(rh)
-            for rh in layClus.rechit_flags():
+            for rh in layClus.rechit_flags:
                 out["rechit_flags"].append(rh)
-            for rh in layClus.rechit_layerclusterid():
+            for rh in layClus.rechit_layerclusterid:
                 out["rechit_layerclusterid"].append(rh)
                    
     #---------------------------------------------------------------------------------------------------
@@ -449,16 +449,16 @@ def analyzeLayerClustersFromTracksters(layerClusters,currentevent,currenteventFr
     for lc in layerClusters: 
         outLC["layerCluster_EventId"].append(currentevent)
         outLC["layerCluster_EventIdFromFile"].append(currenteventFromFile)
-        outLC["layerCluster_id"].append(lc.id())
-        outLC["layerCluster_trackster_id"].append(lc.trackster_id())
-        outLC["layerCluster_eta"].append(lc.eta())
-        outLC["layerCluster_phi"].append(lc.phi())
-        outLC["layerCluster_pt"].append(lc.pt())
-        outLC["layerCluster_energy"].append(lc.energy())
-        outLC["layerCluster_x"].append(lc.x())
-        outLC["layerCluster_y"].append(lc.y())
-        outLC["layerCluster_z"].append(lc.z())
-        outLC["layerCluster_layer"].append(lc.layer())
+        outLC["layerCluster_id"].append(lc.id)
+        outLC["layerCluster_trackster_id"].append(lc.trackster_id)
+        outLC["layerCluster_eta"].append(lc.eta)
+        outLC["layerCluster_phi"].append(lc.phi)
+        outLC["layerCluster_pt"].append(lc.pt)
+        outLC["layerCluster_energy"].append(lc.energy)
+        outLC["layerCluster_x"].append(lc.x)
+        outLC["layerCluster_y"].append(lc.y)
+        outLC["layerCluster_z"].append(lc.z)
+        outLC["layerCluster_layer"].append(lc.layer)
         #outLC["layerCluster_nhitCore"].append(lc.nhitCore)
         #outLC["layerCluster_nhitAll"].append(lc.nhitAll)
 
@@ -486,8 +486,8 @@ def analyzeTracksters(ntuple,tree,maxEvents,outDir,output,verbosityLevel):
 
         recHits  = event.recHits()
         #These LCs are the ones associated with tracksters. 
-        layerClusters = event.layerClusters()
-        tracksters = event.tracksters()
+        layerClusters = event.layerClusters(flyweight=True)
+        tracksters = event.tracksters(flyweight=True)
 
         #Create a dataframe with the LayerClusters of the Tracksters
         dflcur = analyzeLayerClustersFromTracksters(layerClusters, currentevent, currenteventFromFile)
@@ -502,70 +502,70 @@ def analyzeTracksters(ntuple,tree,maxEvents,outDir,output,verbosityLevel):
         
         for trstIndex, trst in enumerate(tracksters):
             #print(trstIndex)
-            for edge in trst.numedges():
+            for edge in trst.numedges:
                 out["EventId"].append(currentevent)
                 out["EventIdFromFile"].append(currenteventFromFile)
                 out["trstIndex"].append(trstIndex)
                 #Per Trackster in per edge
-                out["trackster_x"].append(trst.x())
-                out["trackster_y"].append(trst.y())
-                out["trackster_z"].append(trst.z())
-                out["trackster_eta"].append(trst.eta())
-                out["trackster_phi"].append(trst.phi())
-                out["trackster_firstlayer"].append(trst.firstlayer())
-                out["trackster_lastlayer"].append(trst.lastlayer())
-                out["trackster_layersnum"].append(trst.layersnum())
-                out["trackster_id"].append(trst.id())
-                out["trackster_time"].append(trst.time())
-                out["trackster_timeError"].append(trst.timeError())
-                out["trackster_regr_energy"].append(trst.regr_energy())
-                out["trackster_raw_energy"].append(trst.raw_energy())
-                out["trackster_raw_em_energy"].append(trst.raw_em_energy())
-                out["trackster_raw_pt"].append(trst.raw_pt())
-                out["trackster_raw_em_pt"].append(trst.raw_em_pt())
-                out["trackster_id_prob_1"].append(trst.id_prob_1())
-                out["trackster_id_prob_2"].append(trst.id_prob_2())
-                out["trackster_id_prob_3"].append(trst.id_prob_3())
-                out["trackster_id_prob_4"].append(trst.id_prob_4())
-                out["trackster_id_prob_5"].append(trst.id_prob_5())
-                out["trackster_id_prob_6"].append(trst.id_prob_6())
-                out["trackster_id_prob_7"].append(trst.id_prob_7())
-                out["trackster_id_prob_8"].append(trst.id_prob_8())
+                out["trackster_x"].append(trst.x)
+                out["trackster_y"].append(trst.y)
+                out["trackster_z"].append(trst.z)
+                out["trackster_eta"].append(trst.eta)
+                out["trackster_phi"].append(trst.phi)
+                out["trackster_firstlayer"].append(trst.firstlayer)
+                out["trackster_lastlayer"].append(trst.lastlayer)
+                out["trackster_layersnum"].append(trst.layersnum)
+                out["trackster_id"].append(trst.id)
+                out["trackster_time"].append(trst.time)
+                out["trackster_timeError"].append(trst.timeError)
+                out["trackster_regr_energy"].append(trst.regr_energy)
+                out["trackster_raw_energy"].append(trst.raw_energy)
+                out["trackster_raw_em_energy"].append(trst.raw_em_energy)
+                out["trackster_raw_pt"].append(trst.raw_pt)
+                out["trackster_raw_em_pt"].append(trst.raw_em_pt)
+                out["trackster_id_prob_1"].append(trst.id_prob_1)
+                out["trackster_id_prob_2"].append(trst.id_prob_2)
+                out["trackster_id_prob_3"].append(trst.id_prob_3)
+                out["trackster_id_prob_4"].append(trst.id_prob_4)
+                out["trackster_id_prob_5"].append(trst.id_prob_5)
+                out["trackster_id_prob_6"].append(trst.id_prob_6)
+                out["trackster_id_prob_7"].append(trst.id_prob_7)
+                out["trackster_id_prob_8"].append(trst.id_prob_8)
                 #Per edge
                 out["trackster_edge"].append(edge)
-            for layer_in in trst.edge_layerin():
+            for layer_in in trst.edge_layerin:
                 out["trackster_edge_layerin"].append(layer_in)
-            for layer_in_id in trst.edge_layerin_id():
+            for layer_in_id in trst.edge_layerin_id:
                 out["trackster_edge_layerin_id"].append(layer_in_id)
                 out["trackster_edge_layerin_x"].append(LC_idtoX[layer_in_id])
                 out["trackster_edge_layerin_y"].append(LC_idtoY[layer_in_id])
                 out["trackster_edge_layerin_z"].append(LC_idtoZ[layer_in_id])
                 out["trackster_edge_layerin_R"].append( np.sqrt( LC_idtoX[layer_in_id]**2 + LC_idtoY[layer_in_id]**2 ) )
                 #print(layer_in_id, LC_idtoX[layer_in_id])
-            for layer_out in trst.edge_layerout():
+            for layer_out in trst.edge_layerout:
                 out["trackster_edge_layerout"].append(layer_out)
-            for layer_out_id in trst.edge_layerout_id():
+            for layer_out_id in trst.edge_layerout_id:
                 out["trackster_edge_layerout_id"].append(layer_out_id)
                 out["trackster_edge_layerout_x"].append(LC_idtoX[layer_out_id])
                 out["trackster_edge_layerout_y"].append(LC_idtoY[layer_out_id])
                 out["trackster_edge_layerout_z"].append(LC_idtoZ[layer_out_id])
                 out["trackster_edge_layerout_R"].append( np.sqrt( LC_idtoX[layer_out_id]**2 + LC_idtoY[layer_out_id]**2 ) )     
-            for delta_energy in trst.delta_energy():
+            for delta_energy in trst.delta_energy:
                 out["trackster_delta_energy"].append(delta_energy)
-            for delta_energy_relative in trst.delta_energy_relative():
+            for delta_energy_relative in trst.delta_energy_relative:
                 out["trackster_delta_energy_relative"].append(delta_energy_relative)
-            for delta_layer in trst.delta_layer():
+            for delta_layer in trst.delta_layer:
                 out["trackster_delta_layer"].append(delta_layer)
-            for angle_alpha in trst.angle_alpha():
+            for angle_alpha in trst.angle_alpha:
                 out["trackster_angle_alpha"].append(angle_alpha)
-            for angle_alpha_alternative in trst.angle_alpha_alternative():
+            for angle_alpha_alternative in trst.angle_alpha_alternative:
                 out["trackster_angle_alpha_alternative"].append(angle_alpha_alternative)
             #beta angle has a different number of entries and will be dealt with differently    
-            #for angle_beta in trst.angle_beta():
+            #for angle_beta in trst.angle_beta:
                 #out["trackster_angle_beta"].append(angle_beta)
         
     #print(layer_in)
-    #print(dfl[ (dfl['layerCluster_id'] == layer_in) & (dfl['layerCluster_trackster_id'] == trst.id())])
+    #print(dfl[ (dfl['layerCluster_id'] == layer_in) & (dfl['layerCluster_trackster_id'] == trst.id)])
     #ddfl = dfl[ dfl['layerCluster_id'] == layer_in]
     #print(ddfl[['layerCluster_x','layerCluster_y']].values[[0]])
     #out["trackster_edge_layerin_x"].append()
@@ -615,94 +615,94 @@ def analyzeTrackstersAssociators(ntuple,tree,maxEvents,outDir,output,verbosityLe
         #if currentevent % 100 != 0 : continue
         if (verbosityLevel>=1 and currentevent % 1 == 0): print( "\nCurrent event: ", currentevent)
 
-        tracksters = event.tracksters()
+        tracksters = event.tracksters(flyweight=True)
 
         for trstIndex, trst in enumerate(tracksters):
             #print(trstIndex)
             #Fill the per Trackster variables but per SimTrackster associated to produce the dataframe
-            for tr in trst.numberOfHitsInTS():
+            for tr in trst.numberOfHitsInTS:
                 outTS["EventId"].append(currentevent)
                 outTS["EventIdFromFile"].append(currenteventFromFile)
                 outTS["trstIndex"].append(trstIndex)
                 outTS["numberOfHitsInTS"].append(tr)
-            for tr in trst.Raw_Energy():
+            for tr in trst.Raw_Energy:
                 outTS["raw_energy"].append(tr)
-            for tr in trst.numberOfNoiseHitsInTS():
+            for tr in trst.numberOfNoiseHitsInTS:
                 outTS["numberOfNoiseHitsInTS"].append(tr)
-            for tr in trst.maxCPId_byNumberOfHits():
+            for tr in trst.maxCPId_byNumberOfHits:
                 outTS["maxCPId_byNumberOfHits"].append(tr)
-            for tr in trst.maxCPNumberOfHitsInTS():
+            for tr in trst.maxCPNumberOfHitsInTS:
                 outTS["maxCPNumberOfHitsInTS"].append(tr)
-            for tr in trst.maxCPId_byEnergy():
+            for tr in trst.maxCPId_byEnergy:
                 outTS["maxCPId_byEnergy"].append(tr)
-            for tr in trst.maxEnergySharedTSandCP():
+            for tr in trst.maxEnergySharedTSandCP:
                 outTS["maxEnergySharedTSandCP"].append(tr)
-            for tr in trst.totalCPEnergyFromLayerCP():
+            for tr in trst.totalCPEnergyFromLayerCP:
                 outTS["totalCPEnergyFromLayerCP"].append(tr)
-            for tr in trst.energyFractionOfTSinCP():
+            for tr in trst.energyFractionOfTSinCP:
                 outTS["energyFractionOfTSinCP"].append(tr)
-            for tr in trst.energyFractionOfCPinTS():
+            for tr in trst.energyFractionOfCPinTS:
                 outTS["energyFractionOfCPinTS"].append(tr)
-            for tr in trst.cpId():
+            for tr in trst.cpId:
                 outTS["cpId"].append(tr)
-            for tr in trst.scId():
+            for tr in trst.scId:
                 outTS["scId"].append(tr)
-            for tr in trst.Id():
+            for tr in trst.Id:
                 outTS["Id"].append(tr)
-            for tr in trst.numofvertices():
+            for tr in trst.numofvertices:
                 outTS["numofvertices"].append(tr)
-            for tr in trst.score_trackster2caloparticle():
+            for tr in trst.score_trackster2caloparticle:
                 outTS["score_trackster2caloparticle"].append(tr)
-            for tr in trst.sharedenergy_trackster2caloparticle():
+            for tr in trst.sharedenergy_trackster2caloparticle:
                 outTS["sharedenergy_trackster2caloparticle"].append(tr)
-            #for tr in trst.score_trackster2bestCaloparticle():
+            #for tr in trst.score_trackster2bestCaloparticle:
             #    outTS["score_trackster2bestCaloparticle"].append(tr)
-            #for tr in trst.sharedenergy_trackster2bestCaloparticle():
+            #for tr in trst.sharedenergy_trackster2bestCaloparticle:
             #    outTS["sharedenergy_trackster2bestCaloparticle"].append(tr)
-            #for tr in trst.trackster2bestCaloparticle_eta():
+            #for tr in trst.trackster2bestCaloparticle_eta:
             #    outTS["trackster2bestCaloparticle_eta"].append(tr)
-            #for tr in trst.trackster2bestCaloparticle_phi():
+            #for tr in trst.trackster2bestCaloparticle_phi:
             #    outTS["trackster2bestCaloparticle_phi"].append(tr)
-            #for tr in trst.score_trackster2bestCaloparticle2():
+            #for tr in trst.score_trackster2bestCaloparticle2:
             #    outTS["score_trackster2bestCaloparticle2"].append(tr)
-            #for tr in trst.sharedenergy_trackster2bestCaloparticle2():
+            #for tr in trst.sharedenergy_trackster2bestCaloparticle2:
             #    outTS["sharedenergy_trackster2bestCaloparticle2"].append(tr)
-            for sts in trst.sts_cpId():
+            for sts in trst.sts_cpId:
                 outST["EventId"].append(currentevent)
                 outST["EventIdFromFile"].append(currenteventFromFile)
                 outST["trstIndex"].append(trstIndex)
                 outST["sts_cpId"].append(sts)
-            for sts in trst.sts_id():
+            for sts in trst.sts_id:
                 outST["sts_id"].append(sts)
-            for sts in trst.sts_ts_id():
+            for sts in trst.sts_ts_id:
                 outST["sts_ts_id"].append(sts)
-            for sts in trst.sts_SimEnergy():
+            for sts in trst.sts_SimEnergy:
                 outST["sts_SimEnergy"].append(sts)
-            for sts in trst.sts_SimEnergyWeight():
+            for sts in trst.sts_SimEnergyWeight:
                 outST["sts_SimEnergyWeight"].append(sts)
-            for sts in trst.sts_trackster_raw_energy():
+            for sts in trst.sts_trackster_raw_energy:
                 outST["sts_trackster_raw_energy"].append(sts)
-            for sts in trst.sts_score_caloparticle2trackster():
+            for sts in trst.sts_score_caloparticle2trackster:
                 outST["sts_score_caloparticle2trackster"].append(sts)
-            for sts in trst.sts_sharedenergy_caloparticle2trackster():
+            for sts in trst.sts_sharedenergy_caloparticle2trackster:
                 outST["sts_sharedenergy_caloparticle2trackster"].append(sts)
-            for sts in trst.sts_eta():
+            for sts in trst.sts_eta:
                 outST["sts_eta"].append(sts)
-            for sts in trst.sts_phi():
+            for sts in trst.sts_phi:
                 outST["sts_phi"].append(sts)
-            for sts in trst.sts_pt():
+            for sts in trst.sts_pt:
                 outST["sts_pt"].append(sts)
-            for sts in trst.sts_raw_energy():
+            for sts in trst.sts_raw_energy:
                 outST["sts_raw_energy"].append(sts)
-            #for sts in trst.sts_scorePur_caloparticle2trackster():
+            #for sts in trst.sts_scorePur_caloparticle2trackster:
             #    outST["sts_scorePur_caloparticle2trackster"].append(sts)
-            #for sts in trst.sts_sharedenergy_caloparticle2trackster_assoc():
+            #for sts in trst.sts_sharedenergy_caloparticle2trackster_assoc:
             #    outST["sts_sharedenergy_caloparticle2trackster_assoc"].append(sts)
-            #for sts in trst.sts_besttrackster_raw_energy():
+            #for sts in trst.sts_besttrackster_raw_energy:
             #    outST["sts_besttrackster_raw_energy"].append(sts)
-            #for sts in trst.sts_scoreDupl_caloparticle2trackster():
+            #for sts in trst.sts_scoreDupl_caloparticle2trackster:
             #    outST["sts_scoreDupl_caloparticle2trackster"].append(sts)
-            #for sts in trst.sts_sharedenergy_caloparticle2trackster_assoc2():
+            #for sts in trst.sts_sharedenergy_caloparticle2trackster_assoc2:
             #    outST["sts_sharedenergy_caloparticle2trackster_assoc2"].append(sts)
             
 
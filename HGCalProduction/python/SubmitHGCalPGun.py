@@ -7,6 +7,7 @@ import fnmatch
 import time
 import math
 import re
+import pickle
 
 eosExec = 'eos'
 
@@ -56,6 +57,7 @@ def createParser():
     parser.add_option('', '--storePFCandidates',  action='store_true', dest='storePFCandidates',  default=False, help='store PFCandidates collection')
     parser.add_option('', '--multiClusterTag',  action='store', dest='MULTICLUSTAG', default="hgcalMultiClusters", help='name of HGCalMultiCluster InputTag - use hgcalLayerClusters before CMSSW_10_3_X')
     parser.add_option('', '--keepDQMfile',  action='store_true', dest='DQM',  default=False, help='store the DQM file in relevant folder locally or in EOS, default is False.')
+    parser.add_option('', '--pickleCfg',  action='store_true', dest='PICKLE',  default=False, help='build the GSD cms.Process once at submission and store it pickled, so that each job only sets its seeds and output file, default is False.')
     parser.add_option('', '--requestGPUs',  action='store_true', dest='GPU',  default=False, help='if used then it is set to True and will use in condor GPU machines, default is False. Keep in mind that GPU machines are limited in contrary to CPU.')
 
     return parser
@@ -89,6 +91,11 @@ def parseOptions(parser=None, opt=None):
         parser.error('Particle gun type ' + opt.gunType + ' is not supported. Exiting...')
         sys.exit()
 
+    # the pickled process is only available for the GEN stage
+    if opt.PICKLE and opt.DTIER not in ['GSD', 'ALL']:
+        parser.error('Option --pickleCfg is not supported for data tier ' + opt.DTIER + '. Exiting...')
+        sys.exit()
+
     # Set upper threshold to lower value if upper one not set
     if opt.thresholdMax < 0:
         opt.thresholdMax = opt.thresholdMin
@@ -131,6 +138,15 @@ def parseOptions(parser=None, opt=None):
     return opt
 
 
+### build the cms.Process of a config once and store it pickled
+def pickleProcess(cfg, pklfile):
+    namespace = {}
+    exec(cfg, namespace)
+    f_pickle = open(pklfile, 'wb')
+    pickle.dump(namespace['process'], f_pickle, protocol=2)
+    f_pickle.close()
+
+
 ### processing the external os commands
 def processCmd(cmd, quite = 0):
     #print cmd
@@ -315,6 +331,13 @@ def submitHGCalProduction(*args, **kwargs):
     template=f_template.read()
     f_template.close()
 
+    # read the template loading the pickled process
+    if opt.PICKLE:
+        fp_template= open('partGun_GSD_pickled_template.py', 'r')
+        p_template=fp_template.read()
+        fp_template.close()
+        pklfile_path = ''
+
 
     if (opt.DTIER == 'ALL'):
 
@@ -419,6 +442,18 @@ def submitHGCalProduction(*args, **kwargs):
                 s_template=s_template.replace('DUMMYRANDOMSHOOT',str(opt.randomShoot))
                 s_template=s_template.replace('DUMMYNRANDOMPARTICLES',str(opt.NRANDOMPART))
 
+            # the configs of the jobs only differ by their seeds and output file names:
+            # build the process once and let each job load it and set those
+            if opt.PICKLE:
+                if pklfile_path == '':
+                    pklfile_path = currentDir + '/' + outDir + '/cfg/partGun_GSD.pkl'
+                    pickleProcess(s_template, pklfile_path)
+                s_template=p_template
+                s_template=s_template.replace('DUMMYPICKLEFILE',pklfile_path)
+                s_template=s_template.replace('DUMMYEVTSPERJOB',str(opt.EVTSPERJOB))
+                s_template=s_template.replace('DUMMYSEED',str(job))
+                s_template=s_template.replace('DUMMYFILENAME',outfile)
+
         elif (opt.DTIER == 'RECO' or opt.DTIER == 'NTUP'):
             # prepare RECO inputs
             inputFilesListPerJob = inputFilesList[(job-1)*nFilesPerJob:(job)*nFilesPerJob]
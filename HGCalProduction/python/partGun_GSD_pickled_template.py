@@ -0,0 +1,20 @@
+import pickle
+import FWCore.ParameterSet.Config as cms
+
+# process built once from partGun_GSD_template.py by SubmitHGCalPGun.py --pickleCfg,
+# only the parameters which differ between the jobs are set here
+with open('DUMMYPICKLEFILE', 'rb') as f_pickle:
+    process = pickle.load(f_pickle)
+
+process.maxEvents.input = cms.untracked.int32(DUMMYEVTSPERJOB)
+
+# random seeds
+process.RandomNumberGeneratorService.generator.initialSeed = cms.untracked.uint32(DUMMYSEED)
+process.RandomNumberGeneratorService.VtxSmeared.initialSeed = cms.untracked.uint32(DUMMYSEED)
+process.RandomNumberGeneratorService.mix.initialSeed = cms.untracked.uint32(DUMMYSEED)
+
+# Input source
+process.source.firstLuminosityBlock = cms.untracked.uint32(DUMMYSEED)
+
+# Output definition
+process.FEVTDEBUGHLToutput.fileName = cms.untracked.string('file:DUMMYFILENAME')
@@ -19,7 +19,10 @@ process.FEVTDEBUGHLToutput.fileName = cms.untracked.string('file:DUMMYFILENAME')
 
 gunmode = 'GUNMODE'
 
-if gunmode == 'default':
+# Only the generator of the chosen gun mode is built. The placeholders of
+# the other modes are left unsubstituted, which is fine as long as their
+# functions are never called.
+def _makeDefault(process):
     process.generator = cms.EDProducer("GUNPRODUCERTYPE",
         AddAntiParticle = cms.bool(True),
         PGunParameters = cms.PSet(
@@ -36,7 +39,8 @@ if gunmode == 'default':
         firstRun = cms.untracked.uint32(1),
         psethack = cms.string('multiple particles predefined pT/E eta 1p479 to 3')
     )
-elif gunmode == 'pythia8':
+
+def _makePythia8(process):
     process.generator = cms.EDFilter("GUNPRODUCERTYPE",
         maxEventsToPrint = cms.untracked.int32(1),
         pythiaPylistVerbosity = cms.untracked.int32(1),
@@ -53,7 +57,8 @@ elif gunmode == 'pythia8':
           ),
         PythiaParameters = cms.PSet(parameterSets = cms.vstring())
     )
-elif gunmode == 'closeby':
+
+def _makeCloseby(process):
     process.generator = cms.EDProducer("GUNPRODUCERTYPE",
         AddAntiParticle = cms.bool(False),
         PGunParameters = cms.PSet(
@@ -80,7 +85,8 @@ elif gunmode == 'closeby':
         psethack = cms.string('single or multiple particles predefined E moving vertex'),
         firstRun = cms.untracked.uint32(1)
     )
-elif gunmode == 'physproc':
+
+def _makePhysproc(process):
 
     # GUNPRODUCERTYPE is a string in the form of proc[:jetColl:threshold:min_jets]
     physicsProcess = 'GUNPRODUCERTYPE'
@@ -91,7 +97,7 @@ elif gunmode == 'physproc':
     ptMin = DUMMYTHRESHMIN
     ptMax = DUMMYTHRESHMAX
 
-    from reco_prodtools.templates.hgcBiasedGenProcesses_cfi import *
+    from reco_prodtools.templates.hgcBiasedGenProcesses_cfi import defineProcessGenerator, defineJetBasedBias
 
     #define the process
     #print 'Setting process to', proc
@@ -109,3 +115,10 @@ elif gunmode == 'physproc':
         filterPath = defineJetBasedBias(process, jetColl=jetColl, thr=thr, minObj=minObj)
         process.schedule.extend([filterPath])
         process.FEVTDEBUGHLToutput.SelectEvents.SelectEvents=cms.vstring(filterPath.label())
+
+{
+    'default': _makeDefault,
+    'pythia8': _makePythia8,
+    'closeby': _makeCloseby,
+    'physproc': _makePhysproc,
+}[gunmode](process)